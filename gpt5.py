@@ -1,20 +1,11 @@
 #!/usr/bin/env python3
 # webos_win95_vibes_one_shot.py
-# Single-file retro desktop with terminal using Tkinter + Pygame (headless loop)
+# Single-file retro desktop with terminal using Tkinter
 # No external assets, all vibes in one shot.
 
-import os
 import sys
 import time
-import threading
-import queue
 import math
-import random
-from datetime import datetime
-
-# Ensure Pygame runs headless (no window). We only use its clock/timing.
-os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
-os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
 try:
     import tkinter as tk
@@ -23,13 +14,6 @@ except Exception:
     print("Tkinter is required.")
     sys.exit(1)
 
-try:
-    import pygame
-    from pygame import time as pyg_time
-except Exception:
-    print("Pygame is required. Install with: pip install pygame")
-    sys.exit(1)
-
 
 class RetroPalette:
     BG = "#c0c0c0"  # classic gray
@@ -46,28 +30,16 @@ class RetroPalette:
     HILIGHT_TEXT = "#ffffff"
 
 
-def draw_95_button(widget, relief="raised", padx=6, pady=2):
-    # Give a Win95-like border feel using ttk styles is tricky; we’ll simulate
-    # by wrapping in a Frame with raised edges and a flat button.
-    container = tk.Frame(
-        widget.master,
-        bg=RetroPalette.BTN_FACE,
-        highlightthickness=0,
-        bd=0,
-    )
-    border = tk.Frame(container, bg=RetroPalette.BTN_FACE, bd=2, relief="raised")
-    widget.master = border  # re-parent visually
-    widget.pack(in_=border, padx=padx, pady=pady)
-    border.pack(fill="both", expand=True)
-    return container
-
-
 class Win95Window(tk.Frame):
     def __init__(self, master, title="Window", w=420, h=260, x=80, y=80):
         super().__init__(master, bg=RetroPalette.BG, bd=2, relief="ridge")
         self.place(x=x, y=y, width=w, height=h)
 
-        self._drag = {"x": 0, "y": 0, "active": False}
+        self._drag_active = False
+        self._drag_ox = 0
+        self._drag_oy = 0
+        self._drag_px = 0
+        self._drag_py = 0
         # Title bar
         self.titlebar = tk.Frame(self, bg=RetroPalette.HILIGHT, height=22)
         self.titlebar.pack(fill="x", side="top")
@@ -82,10 +54,10 @@ class Win95Window(tk.Frame):
         )
         self.title_lbl.pack(side="left", fill="x", expand=True)
 
-        self.btn_close = tk.Button(
+        self.btn_close = ttk.Button(
             self.titlebar,
             text="X",
-            relief="raised",
+            style="Win95.TButton",
             width=3,
             command=self.destroy_window,
         )
@@ -96,7 +68,7 @@ class Win95Window(tk.Frame):
         self.content.pack(fill="both", expand=True)
 
         # Resize grip
-        self.grip = tk.Sizegrip(self)
+        self.grip = ttk.Sizegrip(self)
         self.grip.place(relx=1.0, rely=1.0, anchor="se")
 
         # Bind move
@@ -105,32 +77,32 @@ class Win95Window(tk.Frame):
             wdg.bind("<B1-Motion>", self.on_drag_move)
             wdg.bind("<ButtonRelease-1>", self.on_drag_end)
 
-        # Raise on click
+        # Raise on click (the title bar raises via on_drag_start; a second
+        # <Button-1> bind there would replace the drag handler)
         self.bind("<Button-1>", lambda e: self.lift())
-        self.titlebar.bind("<Button-1>", lambda e: self.lift())
-        self.title_lbl.bind("<Button-1>", lambda e: self.lift())
 
     def destroy_window(self):
         self.place_forget()
         self.destroy()
 
     def on_drag_start(self, event):
-        self._drag["x"] = event.x
-        self._drag["y"] = event.y
-        self._drag["active"] = True
+        # Cache window origin and pointer (screen coords) once per drag
+        self._drag_ox = self.winfo_x()
+        self._drag_oy = self.winfo_y()
+        self._drag_px = event.x_root
+        self._drag_py = event.y_root
+        self._drag_active = True
         self.lift()
 
     def on_drag_move(self, event):
-        if not self._drag["active"]:
+        if not self._drag_active:
             return
-        dx = event.x - self._drag["x"]
-        dy = event.y - self._drag["y"]
-        x = self.winfo_x() + dx
-        y = self.winfo_y() + dy
+        x = self._drag_ox + event.x_root - self._drag_px
+        y = self._drag_oy + event.y_root - self._drag_py
         self.place(x=x, y=y)
 
     def on_drag_end(self, _):
-        self._drag["active"] = False
+        self._drag_active = False
 
 
 class Win95Taskbar(tk.Frame):
@@ -138,10 +110,10 @@ class Win95Taskbar(tk.Frame):
         super().__init__(master, bg=RetroPalette.TASKBAR, height=height, bd=2, relief="ridge")
         self.pack(side="bottom", fill="x")
 
-        self.start_btn = tk.Button(
+        self.start_btn = ttk.Button(
             self,
             text="Start",
-            relief="raised",
+            style="Win95.TButton",
             width=8,
             command=start_callback if start_callback else lambda: None,
         )
@@ -177,46 +149,107 @@ class TerminalWindow(Win95Window):
             insertbackground="#00ff00",
             font=("Consolas", 10),
             wrap="word",
+            # Already the Tk default; a terminal has no use for undo history
+            undo=False,
         )
         self.text.pack(fill="both", expand=True)
         self.text.bind("<Return>", self._on_return)
-        self.text.bind("<Key>", self._on_key)
+        self.text.bind("<BackSpace>", self._guard_backspace)
+        self.text.bind("<Delete>", self._guard_delete)
+        self.text.bind("<<Cut>>", self._guard_cut)
+        # Cursor movement comes through Tk's virtual events, which also
+        # carry the emacs-style keys (Ctrl-b/a/p on X11)
+        for seq in ("<<PrevChar>>", "<<SelectPrevChar>>", "<<PrevWord>>",
+                    "<<SelectPrevWord>>", "<Control-h>", "<Control-t>"):
+            self.text.bind(seq, self._guard_prompt)
+        for seq in ("<<PrevLine>>", "<<SelectPrevLine>>", "<<PrevPara>>",
+                    "<<SelectPrevPara>>", "<Prior>", "<Shift-Prior>"):
+            self.text.bind(seq, lambda e: "break")
+        for seq in ("<<LineStart>>", "<Control-Home>"):
+            self.text.bind(seq, self._on_line_start)
+        for seq in ("<<SelectLineStart>>", "<Control-Shift-Home>"):
+            self.text.bind(seq, self._on_select_line_start)
+        # Clicking into old output (e.g. to copy) leaves the cursor on the input line
+        self.text.bind("<ButtonRelease-1>", self._snap_to_input)
         self.prompt = "C:\\webos95> "
+        self._cmd_table = {
+            "help": self._cmd_help,
+            "?": self._cmd_help,
+            "echo": self._cmd_echo,
+            "time": self._cmd_time,
+            "clear": self._cmd_clear,
+            "about": self._cmd_about,
+            "vibes": self._cmd_vibes,
+        }
         self._append_line("webOS 95 Terminal")
         self._append_line("Type 'help' for commands.")
         self._write_prompt()
 
-        self._lock_input_to_end = True
-        self._input_start_idx = self.text.index("end-1c")
-
     def _append_line(self, s=""):
         self.text.insert("end", s + "\n")
         self.text.see("end")
 
     def _write_prompt(self):
         self.text.insert("end", self.prompt)
-        self._input_start_idx = self.text.index("end-1c")
+        # Input starts at the "prompt" mark; left gravity keeps it in place
+        # while text is typed after it.
+        self.text.mark_set("prompt", "end-1c")
+        self.text.mark_gravity("prompt", "left")
         self.text.see("end")
 
-    def _on_key(self, event):
-        # Prevent editing above prompt
-        try:
-            insert_idx = self.text.index("insert")
-            if self._lock_input_to_end:
-                # If cursor is before input start, move it to end
-                if self.text.compare(insert_idx, "<", self._input_start_idx):
-                    self.text.mark_set("insert", "end-1c")
-            # Prevent backspace beyond prompt
-            if event.keysym == "BackSpace":
-                if self.text.compare(self.text.index("insert"), "<=", self._input_start_idx):
-                    return "break"
-        except Exception:
-            pass
+    def _guard_prompt(self, event):
+        # Prevent backspacing, editing or moving left past the prompt
+        if self.text.compare("insert", "<=", "prompt"):
+            return "break"
+        return None
+
+    def _cursor_in_selection(self):
+        # Same test as tk::TextCursorInSelection: Text's <Delete> and
+        # <BackSpace> only remove the selection when the cursor is inside it
+        return bool(
+            self.text.tag_ranges("sel")
+            and self.text.compare("sel.first", "<=", "insert")
+            and self.text.compare("insert", "<=", "sel.last")
+        )
+
+    def _guard_edit(self, op):
+        if self._cursor_in_selection():
+            blocked = self.text.compare("sel.first", "<", "prompt")
+        else:
+            blocked = self.text.compare("insert", op, "prompt")
+        return "break" if blocked else None
+
+    def _guard_delete(self, event):
+        return self._guard_edit("<")
+
+    def _guard_backspace(self, event):
+        return self._guard_edit("<=")
+
+    def _guard_cut(self, event):
+        # <<Cut>> removes the selection wherever the cursor is
+        if self.text.tag_ranges("sel") and self.text.compare("sel.first", "<", "prompt"):
+            return "break"
+        return None
+
+    def _on_line_start(self, event):
+        self.text.mark_set("insert", "prompt")
+        self.text.tag_remove("sel", "1.0", "end")
+        return "break"
+
+    def _on_select_line_start(self, event):
+        # Select back to the prompt rather than the start of the line; Tk's
+        # own helper keeps the selection anchor in sync for later Shift+keys
+        self.text.tk.call("tk::TextKeySelect", self.text, "prompt")
+        return "break"
+
+    def _snap_to_input(self, event):
+        if self.text.compare("insert", "<", "prompt"):
+            self.text.mark_set("insert", "end-1c")
         return None
 
     def _on_return(self, event):
         # Capture command
-        line = self.text.get(self._input_start_idx, "end-1c")
+        line = self.text.get("prompt", "end-1c")
         cmd = line.strip()
         self._append_line("")  # move to new line after input
         self.handle_command(cmd)
@@ -229,41 +262,49 @@ class TerminalWindow(Win95Window):
         else:
             out = self._default_commands(cmd)
         if out:
-            for line in out.split("\n"):
-                self._append_line(line)
+            # One insert + one see() for the whole response
+            self.text.insert("end", out if out.endswith("\n") else out + "\n")
+            self.text.see("end")
 
     def _default_commands(self, cmd):
         parts = cmd.split()
         if not parts:
             return ""
         name = parts[0].lower()
-        args = parts[1:]
-
-        if name in ("help", "?"):
-            return (
-                "Commands:\n"
-                "  help          Show this help\n"
-                "  echo [text]   Echo text\n"
-                "  time          Show current time\n"
-                "  clear         Clear screen\n"
-                "  about         About this OS\n"
-                "  vibes         Show vibe status\n"
-            )
-        if name == "echo":
-            return " ".join(args)
-        if name == "time":
-            return time.strftime("%Y-%m-%d %H:%M:%S")
-        if name == "clear":
-            self.text.delete("1.0", "end")
-            return ""
-        if name == "about":
-            return (
-                "webOS 95 Vibes — single shot, Tkinter + Pygame headless loop.\n"
-                "Everything 100% in one file. FPS vibes on."
-            )
-        if name == "vibes":
-            return "Vibes = ON. 600 fps spirit mode."
-        return f"Unknown command: {name}"
+        fn = self._cmd_table.get(name)
+        if fn is None:
+            return f"Unknown command: {name}"
+        return fn(parts[1:])
+
+    def _cmd_help(self, args):
+        return (
+            "Commands:\n"
+            "  help          Show this help\n"
+            "  echo [text]   Echo text\n"
+            "  time          Show current time\n"
+            "  clear         Clear screen\n"
+            "  about         About this OS\n"
+            "  vibes         Show vibe status\n"
+        )
+
+    def _cmd_echo(self, args):
+        return " ".join(args)
+
+    def _cmd_time(self, args):
+        return time.strftime("%Y-%m-%d %H:%M:%S")
+
+    def _cmd_clear(self, args):
+        self.text.delete("1.0", "end")
+        return ""
+
+    def _cmd_about(self, args):
+        return (
+            "webOS 95 Vibes — single shot, Tkinter only.\n"
+            "Everything 100% in one file. FPS vibes on."
+        )
+
+    def _cmd_vibes(self, args):
+        return "Vibes = ON. 600 fps spirit mode."
 
 
 class RetroDesktop(tk.Tk):
@@ -273,16 +314,33 @@ class RetroDesktop(tk.Tk):
         self.geometry("1000x640+120+80")
         self.configure(bg=RetroPalette.DESKTOP_GREEN)
 
+        # Win95 button look, resolved once and shared by all buttons
+        style = ttk.Style(self)
+        style.configure(
+            "Win95.TButton",
+            background=RetroPalette.BTN_FACE,
+            foreground=RetroPalette.TEXT,
+            relief="raised",
+            padding=(6, 2),
+        )
+        style.configure("Menu.Win95.TButton", anchor="w")
+
         # Fake Win95-esque wallpaper pattern with canvas
         self.canvas = tk.Canvas(self, bg=RetroPalette.DESKTOP_GREEN, highlightthickness=0)
+        self._wall_tile = None
+        self._wall_img = None
+        self._wall_job = None
+        self._wall_size = None
         self.canvas.pack(fill="both", expand=True)
         self.canvas.bind("<Configure>", self._draw_wallpaper)
+        self._draw_icons_once()
 
         # Taskbar
         self.taskbar = Win95Taskbar(self, start_callback=self._on_start_menu)
 
         # Start menu popup
         self.start_menu = None
+        self._start_open = False
 
         # Terminal
         self.terminal = None
@@ -290,52 +348,82 @@ class RetroDesktop(tk.Tk):
         # Status
         self.running = True
         self.fps_value = 0.0
+        self._t0 = time.perf_counter()
+        self._last_tick = self._t0
+        self._last_fps_int = None
+        self._last_clock_s = None
 
-        # Inter-thread queue
-        self.event_q = queue.Queue()
-
-        # Schedule UI ticks
-        self._schedule_clock()
-        self._schedule_ui_tick()
-
-        # Launch vibes loop in background
-        self._start_headless_pygame_loop()
+        # Schedule UI tick (FPS is measured from the Tk tick itself, so the
+        # first sample must span a full tick interval)
+        self.after(250, self._schedule_clock)
 
         # Open Terminal by default
         self.after(300, self.open_terminal)
 
+    def _wallpaper_tile(self):
+        # Subtle retro diamonds: two lighter dots per 48x48 tile. The photo
+        # data string is built once and reused for every resize.
+        if self._wall_tile is None:
+            step = 24
+            size = step * 2
+            lit = {
+                ((cx + dx) % size, (cy + dy) % size)
+                for cx, cy in ((0, 0), (step, step))
+                for dy in range(-2, 2)
+                for dx in range(-2, 2)
+            }
+            rows = []
+            for y in range(size):
+                row = (
+                    "#70b0b0" if (x, y) in lit else RetroPalette.DESKTOP_GREEN
+                    for x in range(size)
+                )
+                rows.append("{" + " ".join(row) + "}")
+            self._wall_tile = " ".join(rows)
+        return self._wall_tile
+
     def _draw_wallpaper(self, event=None):
-        self.canvas.delete("all")
+        # Coalesce bursts of <Configure> during resizes into one redraw
+        if self._wall_job:
+            self.after_cancel(self._wall_job)
+        self._wall_job = self.after(50, self._draw_wallpaper_real)
+
+    def _draw_wallpaper_real(self):
+        self._wall_job = None
         w = self.canvas.winfo_width()
         h = self.canvas.winfo_height()
-        # Draw subtle retro diamonds
-        step = 24
-        for y in range(0, h + step, step):
-            for x in range(0, w + step, step):
-                r = 8
-                # alternating lighter dots
-                if ((x // step) + (y // step)) % 2 == 0:
-                    self.canvas.create_oval(
-                        x - 2, y - 2, x + 2, y + 2, fill="#70b0b0", width=0
-                    )
-        # Desktop icons (fake)
-        self.canvas.create_rectangle(20, 20, 20 + 36, 20 + 28, fill="#b0d0d0", width=1)
-        self.canvas.create_text(38, 58, text="My Web", fill="white")
-        self.canvas.create_rectangle(20, 90, 20 + 36, 90 + 28, fill="#c0b0d0", width=1)
-        self.canvas.create_text(38, 128, text="Terminal", fill="white")
+        if (w, h) == self._wall_size:
+            return
+        self._wall_size = (w, h)
+        # One canvas-sized image; Tk tiles the pattern across it in a single
+        # put(), and the canvas item picks up the new pixels by itself.
+        if self._wall_img is None:
+            self._wall_img = tk.PhotoImage(width=w, height=h)
+            self.canvas.create_image(0, 0, image=self._wall_img, anchor="nw", tags=("wallpaper",))
+            self.canvas.lower("wallpaper")
+        else:
+            self._wall_img.configure(width=w, height=h)
+        self._wall_img.put(self._wallpaper_tile(), to=(0, 0, w, h))
+
+    def _draw_icons_once(self):
+        # Desktop icons (fake); static, so they survive wallpaper redraws
+        self.canvas.create_rectangle(20, 20, 20 + 36, 20 + 28, fill="#b0d0d0", width=1, tags=("icons",))
+        self.canvas.create_text(38, 58, text="My Web", fill="white", tags=("icons",))
+        term_icon = self.canvas.create_rectangle(
+            20, 90, 20 + 36, 90 + 28, fill="#c0b0d0", width=1, tags=("icons",)
+        )
+        self.canvas.create_text(38, 128, text="Terminal", fill="white", tags=("icons",))
 
         # Clickable icon to open terminal
-        self.canvas.tag_bind("term_icon", "<Button-1>", lambda e: self.open_terminal())
-        # Use a tag by creating a small hidden rect to bind
-        r = self.canvas.create_rectangle(20, 90, 56, 118, outline="", fill="", tags=("term_icon",))
+        self.canvas.tag_bind(term_icon, "<Button-1>", lambda e: self.open_terminal())
 
     def _on_start_menu(self):
-        if self.start_menu and tk.Toplevel.winfo_exists(self.start_menu):
-            self.start_menu.destroy()
-            self.start_menu = None
+        if self._start_open:
+            self._close_start()
             return
 
         self.start_menu = tk.Toplevel(self)
+        self._start_open = True
         self.start_menu.overrideredirect(True)
         self.start_menu.configure(bg=RetroPalette.BG, bd=2, relief="ridge")
 
@@ -347,7 +435,12 @@ class RetroDesktop(tk.Tk):
 
         # Menu items
         def add_item(text, cmd):
-            btn = tk.Button(self.start_menu, text="  " + text, anchor="w", command=lambda: (cmd(), self._close_start()))
+            btn = ttk.Button(
+                self.start_menu,
+                text="  " + text,
+                style="Menu.Win95.TButton",
+                command=lambda: (cmd(), self._close_start()),
+            )
             btn.pack(fill="x")
 
         add_item("Open Terminal", self.open_terminal)
@@ -360,18 +453,20 @@ class RetroDesktop(tk.Tk):
         self.start_menu.focus_force()
 
     def _close_start(self):
-        if self.start_menu and tk.Toplevel.winfo_exists(self.start_menu):
+        if self._start_open and self.start_menu.winfo_exists():
             self.start_menu.destroy()
+        self._start_open = False
         self.start_menu = None
 
     def open_terminal(self):
-        if self.terminal and self.terminal.winfo_exists():
-            try:
-                self.terminal.lift()
-                return
-            except Exception:
-                pass
+        if self.terminal is not None:
+            self.terminal.lift()
+            return
         self.terminal = TerminalWindow(self, w=560, h=320, x=120, y=120)
+        self.terminal.bind("<Destroy>", self._on_terminal_destroy)
+
+    def _on_terminal_destroy(self, event):
+        self.terminal = None
 
     def _about_dialog(self):
         w = Win95Window(self, title="About webOS 95", w=360, h=160, x=180, y=160)
@@ -380,7 +475,7 @@ class RetroDesktop(tk.Tk):
             text=(
                 "webOS 95 Vibes\n"
                 "Single-shot Python script\n"
-                "Tkinter UI + Pygame timing\n"
+                "Tkinter UI + Tk timing\n"
                 "Vibes = ON"
             ),
             bg=RetroPalette.BG,
@@ -389,61 +484,38 @@ class RetroDesktop(tk.Tk):
         lbl.pack(expand=True)
 
     def _schedule_clock(self):
-        self.taskbar.set_clock(time.strftime("%H:%M:%S"))
-        self.after(250, self._schedule_clock)
-
-    def _schedule_ui_tick(self):
-        # Process queued events from pygame loop
-        try:
-            while True:
-                evt = self.event_q.get_nowait()
-                if evt.get("type") == "fps":
-                    self.fps_value = evt.get("value", 0.0)
-                elif evt.get("type") == "vibe":
-                    pass
-        except queue.Empty:
-            pass
-
-        # Update FPS label
-        self.taskbar.set_fps(f"FPS: {int(round(self.fps_value))}")
-        self.after(16, self._schedule_ui_tick)  # ~60Hz UI tick for Tk
-
-    def _start_headless_pygame_loop(self):
-        t = threading.Thread(target=self._pygame_loop, daemon=True)
-        t.start()
-
-    def _pygame_loop(self):
-        pygame.init()
-        clock = pyg_time.Clock()
-
-        # 600 FPS target for vibes only
-        target_fps = 600
-        acc_time = 0.0
-        frames = 0
-        last_report = time.time()
-
-        # Simple vibe oscillator
-        phase = 0.0
-
-        while self.running:
-            # Tick
-            dt_ms = clock.tick(target_fps)
-            dt = dt_ms / 1000.0
-            frames += 1
-            acc_time += dt
-            phase += dt * 2.0 * math.pi  # unused but we could post vibe
-
-            now = time.time()
-            if now - last_report >= 0.25:
-                fps = frames / (now - last_report)
-                frames = 0
-                last_report = now
-                try:
-                    self.event_q.put_nowait({"type": "fps", "value": fps})
-                except Exception:
-                    pass
-
-        pygame.quit()
+        # Measure tick rate from callback deltas, smoothed with an EMA
+        now = time.perf_counter()
+        dt = now - self._last_tick
+        self._last_tick = now
+        if dt > 0:
+            inst = 1.0 / dt
+            if not self.fps_value:
+                # Seed the EMA with the first real sample instead of ramping from 0
+                self.fps_value = inst
+            else:
+                self.fps_value = 0.9 * self.fps_value + 0.1 * inst
+
+        # Label writes yield to pending input events
+        self.after_idle(self._update_taskbar_labels)
+        if self.running:
+            self.after(250, self._schedule_clock)
+
+    def _update_taskbar_labels(self):
+        # Only touch the labels when the displayed value changes
+        now_s = int(time.time())
+        if now_s != self._last_clock_s:
+            self._last_clock_s = now_s
+            self.taskbar.set_clock(time.strftime("%H:%M:%S", time.localtime(now_s)))
+        fps_int = int(round(self.fps_value))
+        if fps_int != self._last_fps_int:
+            self._last_fps_int = fps_int
+            self.taskbar.set_fps(f"FPS: {fps_int}")
+
+    @property
+    def phase(self):
+        # Vibe oscillator (1 Hz), computed on demand instead of per tick
+        return ((time.perf_counter() - self._t0) * 2.0 * math.pi) % (2.0 * math.pi)
 
     def quit_app(self):
         self.running = False